@@ -0,0 +1,109 @@
+"""Benchmark perhitungan deadline: loop per tugas vs kolom (NumPy).
+
+Jalankan: python bench_deadlines.py [jumlah_tugas]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import main
+
+
+def make_tasks(n):
+    """Buat `n` tugas acak dengan deadline -30..+30 hari dari sekarang."""
+    rnd = random.Random(42)
+    now = datetime.now()
+    tasks = []
+    for i in range(n):
+        dl = now + timedelta(minutes=rnd.randint(-30 * 1440, 30 * 1440))
+        tasks.append({
+            "id": i + 1,
+            "nama": f"tugas {i + 1}",
+            "mata_pelajaran": "bench",
+            "deadline": dl.strftime("%d-%m-%Y %H:%M"),
+            "completed": rnd.random() < 0.3,
+            "status": "BELUM",
+            "priority": rnd.choice(main.PRIORITIES),
+            "notified_1d": False,
+            "notified_1h": False,
+        })
+    return tasks
+
+
+def legacy_scan(tasks, now):
+    """Versi lama: parse dan hitung selisih per tugas di Python."""
+    overdue, upcoming, n1d, n1h = [], [], [], []
+    for i, t in enumerate(tasks):
+        try:
+            dl = main.parse_deadline_string(t.get("deadline", ""))
+        except ValueError:
+            continue
+        delta = (dl - now).total_seconds()
+        if delta < 0 and not t.get("completed") and t.get("status") != "TERLAMBAT":
+            overdue.append(i)
+        if 0 < delta <= 86400:
+            upcoming.append((i, divmod(int(delta), 3600)))
+            if not t.get("completed") and not t.get("notified_1d"):
+                n1d.append(i)
+        if 0 < delta <= 3600 and not t.get("completed") and not t.get("notified_1h"):
+            n1h.append(i)
+    counts = {p: 0 for p in main.PRIORITIES}
+    for t in tasks:
+        counts[t.get("priority", "MEDIUM")] = counts.get(t.get("priority", "MEDIUM"), 0) + 1
+    return overdue, upcoming, n1d, n1h, counts
+
+
+def column_scan(cols, now):
+    """Versi kolom: semua tugas diproses sekaligus."""
+    overdue = main.overdue_indices(cols, now)
+    idx, rem = main.window_indices(cols, now, 86400)
+    upcoming = main.split_remaining(rem)
+    n1d = main.window_indices(cols, now, 86400, flag='notified_1d', skip_completed=True)
+    n1h = main.window_indices(cols, now, 3600, flag='notified_1h', skip_completed=True)
+    counts = main.priority_counts(cols)
+    return overdue, upcoming, n1d, n1h, counts
+
+
+def timed(fn, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main_bench(n):
+    tasks = make_tasks(n)
+    now_dt = datetime.now()
+    now = int(now_dt.timestamp())
+
+    def build_and_scan():
+        # cache parse dikosongkan agar setiap ulangan mengukur build dari nol
+        main._hour_epoch.cache_clear()
+        column_scan(main.build_deadline_columns(tasks), now)
+
+    t_legacy = timed(legacy_scan, tasks, now_dt, repeat=3)
+    t_build_scan = timed(build_and_scan, repeat=3)
+    cols = main.build_deadline_columns(tasks)
+    t_cols = timed(column_scan, cols, now)
+
+    engine = "NumPy" if main.np is not None else "Python murni"
+    print(f"Tugas: {n}  (engine: {engine})")
+    print(f"  loop per tugas          : {t_legacy * 1000:9.2f} ms")
+    print(f"  bangun kolom + scan     : {t_build_scan * 1000:9.2f} ms  ({t_legacy / t_build_scan:.1f}x)")
+    print(f"  scan saja (file tetap)  : {t_cols * 1000:9.2f} ms  ({t_legacy / t_cols:.1f}x)")
+
+    t_next_cold = timed(lambda: (main._SCORE_CACHE.update(cols=None, stamp=None),
+                                 main.next_tasks(tasks, 10, cols, now)), repeat=3)
+    main.next_tasks(tasks, 10, cols, now)
+    t_next_warm = timed(main.next_tasks, tasks, 10, cols, now)
+    t_next_hour = timed(main.next_tasks, tasks, 10, cols, now + 3600, repeat=1)
+    print(f"  next (cache kosong)     : {t_next_cold * 1000:9.2f} ms")
+    print(f"  next (cache hangat)     : {t_next_warm * 1000:9.3f} ms")
+    print(f"  next (+1 jam, inkr.)    : {t_next_hour * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
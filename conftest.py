@@ -0,0 +1,54 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    """Setiap test memakai folder kosong untuk tasks.json, arsip dan log."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "_SCORE_CACHE", {
+        "cols": None, "stamp": None, "keys": None, "valid_until": None,
+        "next_change": 0, "top": [], "dirty": False})
+    monkeypatch.setattr(main, "_STORE_CACHE", {"stamp": None, "tasks": None, "cols": None})
+    return tmp_path
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Jalankan test dengan NumPy dan dengan fallback Python murni."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(main, "np", None)
+    return request.param
+
+
+def make_task(i, deadline, status="BELUM", priority="MEDIUM", subject="mtk"):
+    return {
+        "id": i,
+        "nama": f"tugas {i}",
+        "mata_pelajaran": subject,
+        "deadline": deadline,
+        "completed": status == "SELESAI",
+        "status": status,
+        "priority": priority,
+        "notified_1d": False,
+        "notified_1h": False,
+    }
+
+
+def random_tasks(n, seed, now):
+    rnd = random.Random(seed)
+    tasks = []
+    for i in range(n):
+        dl = now + timedelta(seconds=rnd.randint(-2 * 86400, 20 * 86400))
+        status = rnd.choice(["BELUM", "BELUM", "TERLAMBAT", "SELESAI"])
+        t = make_task(i + 1, dl.strftime("%d-%m-%Y %H:%M:%S"), status, rnd.choice(main.PRIORITIES + ("LAIN",)))
+        t["notified_1d"] = rnd.random() < 0.3
+        tasks.append(t)
+    tasks.append(make_task(n + 1, "bukan tanggal"))
+    return tasks
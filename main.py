@@ -1,3 +1,5 @@
+import gzip
+import heapq
 import json
 import os
 import time
@@ -6,10 +8,21 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from tabulate import tabulate
 
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, fallback ke Python murni
+    np = None
+
 # File untuk menyimpan data
 DATA_FILE = "tasks.json"
+# Folder arsip (segmen gzip JSONL per bulan deadline + index)
+ARCHIVE_DIR = "archive"
+ARCHIVE_INDEX = os.path.join(ARCHIVE_DIR, "index.json")
+# Tugas SELESAI diarsipkan setelah deadline-nya lewat lebih dari ini (hari)
+ARCHIVE_AFTER_DAYS = 7
 # Aktifkan/Non-aktifkan bunyi alarm
 SOUND_ENABLED = True
  
@@ -39,15 +52,196 @@ def load_tasks():
     return []
 
 
+def _store_stamp():
+    """Penanda keadaan `tasks.json` (mtime, ukuran) untuk validasi cache."""
+    try:
+        st = os.stat(DATA_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Tugas dan kolom deadline terakhir yang dimuat oleh `load_tasks_cached`
+_STORE_CACHE = {"stamp": None, "tasks": None, "cols": None}
+
+
+def load_tasks_cached():
+    """Muat tugas beserta kolom deadline-nya untuk loop `main()`.
+
+    Selama `tasks.json` tidak berubah (mtime/ukuran sama), list tugas dan
+    kolom yang sama dipakai ulang sehingga tidak ada parse ulang. Setiap
+    perubahan lewat `save_tasks` (termasuk dari thread countdown) mengubah
+    penanda file, jadi pemanggilan berikutnya memuat ulang.
+    Mengembalikan (tasks, cols).
+    """
+    stamp = _store_stamp()
+    if stamp is None or stamp != _STORE_CACHE["stamp"]:
+        # penanda diambil sebelum load: jika file berubah di antaranya,
+        # penanda tidak cocok lagi dan pemanggilan berikutnya memuat ulang
+        tasks = load_tasks()
+        _STORE_CACHE.update(stamp=stamp, tasks=tasks, cols=build_deadline_columns(tasks))
+    return _STORE_CACHE["tasks"], _STORE_CACHE["cols"]
+
+
+# Lock untuk urutan load -> ubah -> simpan tasks.json yang bisa berjalan di
+# thread lain (countdown, arsip). RLock karena save_tasks juga memakainya.
+_STORE_LOCK = threading.RLock()
+
+
 def save_tasks(tasks):
     """Simpan daftar tugas ke file JSON."""
     try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
+        with _STORE_LOCK, open(DATA_FILE, 'w', encoding='utf-8') as f:
             json.dump(tasks, f, indent=2, ensure_ascii=False)
     except Exception:
         pass
 
 
+# --- Arsip (cold tier) ------------------------------------------------------
+# Tugas SELESAI yang deadline-nya sudah lewat lebih dari ARCHIVE_AFTER_DAYS
+# dipindah ke segmen gzip JSONL per bulan deadline (archive/YYYY-MM.jsonl.gz),
+# sehingga `tasks.json` hanya berisi tugas aktif. Tugas yang belum selesai
+# tidak pernah diarsipkan, jadi tetap bisa ditandai selesai atau dihapus.
+# Index menyimpan jumlah tugas, jumlah selesai, hitungan per priority dan mata
+# pelajaran per segmen, serta id terbesar yang pernah dipakai agar id tugas
+# baru tidak bentrok.
+
+
+def load_archive_index():
+    """Baca index arsip; kembalikan index kosong jika belum ada."""
+    try:
+        with open(ARCHIVE_INDEX, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {"max_id": 0, "segments": {}}
+
+
+def _save_archive_index(index):
+    """Simpan index arsip secara atomik."""
+    tmp = ARCHIVE_INDEX + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, ARCHIVE_INDEX)
+
+
+def _should_archive(task, now: int) -> bool:
+    """True jika tugas SELESAI dan deadline-nya lewat lebih dari ARCHIVE_AFTER_DAYS."""
+    dl = _deadline_epoch(task.get('deadline') or '')
+    if dl == NO_DEADLINE or task.get('status') != 'SELESAI':
+        return False
+    return now - dl > ARCHIVE_AFTER_DAYS * 86400
+
+
+def _has_archivable(cols, now: int) -> bool:
+    """Cek cepat lewat kolom apakah ada tugas yang perlu diarsipkan."""
+    dl = cols['deadline']
+    cutoff = now - ARCHIVE_AFTER_DAYS * 86400
+    if np is not None:
+        return bool(np.any(cols['done'] & (dl != NO_DEADLINE) & (dl < cutoff)))
+    return any(done and d != NO_DEADLINE and d < cutoff for done, d in zip(cols['done'], dl))
+
+
+def archive_old_tasks(tasks, cols=None) -> int:
+    """Pindahkan tugas SELESAI yang sudah lama ke arsip.
+
+    `tasks`/`cols` hanya dipakai untuk cek cepat; keputusan akhir diambil
+    dari `tasks.json` yang dibaca ulang di dalam `_STORE_LOCK`, sehingga
+    thread countdown tidak bisa menulis balik tugas yang sudah diarsipkan
+    di tengah proses. Segmen ditulis lebih dulu, baru
+    `tasks.json` disimpan ulang, sehingga tugas tidak hilang jika proses
+    terhenti di tengah jalan. Mengembalikan jumlah tugas yang diarsipkan.
+    """
+    now = int(datetime.now().timestamp())
+    if cols is None:
+        cols = build_deadline_columns(tasks)
+    if not _has_archivable(cols, now):
+        return 0
+
+    with _STORE_LOCK:
+        current = load_tasks()
+        hot, by_segment = [], {}
+        for t in current:
+            if _should_archive(t, now):
+                # bulan segmen dari epoch yang sama dengan keputusan arsip,
+                # jadi tidak ada parser kedua yang bisa menolak deadline ini
+                seg = datetime.fromtimestamp(_deadline_epoch(t['deadline'])).strftime('%Y-%m')
+                by_segment.setdefault(seg, []).append(t)
+            else:
+                hot.append(t)
+        if not by_segment:
+            return 0
+
+        try:
+            os.makedirs(ARCHIVE_DIR, exist_ok=True)
+            index = load_archive_index()
+            segments = index.setdefault("segments", {})
+            for seg, items in sorted(by_segment.items()):
+                entry = segments.setdefault(seg, {"file": f"{seg}.jsonl.gz", "count": 0, "done": 0,
+                                                  "priority": {}, "subjects": []})
+                with gzip.open(os.path.join(ARCHIVE_DIR, entry["file"]), 'at', encoding='utf-8') as f:
+                    for t in items:
+                        f.write(json.dumps(t, ensure_ascii=False) + "\n")
+                entry["count"] += len(items)
+                entry["done"] += sum(1 for t in items if t.get('status') == 'SELESAI')
+                pri = entry["priority"]
+                for t in items:
+                    p = t.get('priority', 'MEDIUM')
+                    pri[p] = pri.get(p, 0) + 1
+                entry["subjects"] = sorted(set(entry["subjects"]) | {t.get('mata_pelajaran', '') for t in items})
+            index["max_id"] = max([index.get("max_id", 0)] + [t.get('id', 0) for t in current])
+            _save_archive_index(index)
+        except Exception:
+            # Gagal menulis arsip: biarkan semua tugas tetap aktif
+            return 0
+        save_tasks(hot)
+
+    moved = len(current) - len(hot)
+    log_event(f"Arsipkan {moved} tugas")
+    return moved
+
+
+def archive_stats():
+    """Total (jumlah, selesai, per priority) dari hitungan per segmen di index arsip."""
+    total, done, pri_counts = 0, 0, {}
+    for entry in load_archive_index().get("segments", {}).values():
+        total += entry["count"]
+        done += entry["done"]
+        for p, c in entry["priority"].items():
+            pri_counts[p] = pri_counts.get(p, 0) + c
+    return total, done, pri_counts
+
+
+def iter_archive(since: str = None, until: str = None, subject: str = None):
+    """Baca tugas dari arsip segmen demi segmen (lazy).
+
+    - `since` / `until`: batas bulan deadline format YYYY-MM (inklusif).
+    - `subject`: hanya segmen yang memuat mata pelajaran ini (tanpa beda huruf).
+    """
+    index = load_archive_index()
+    subj = subject.lower() if subject else None
+    for seg, entry in sorted(index.get("segments", {}).items()):
+        if since and seg < since:
+            continue
+        if until and seg > until:
+            continue
+        if subj and subj not in (s.lower() for s in entry.get("subjects", [])):
+            continue
+        try:
+            with gzip.open(os.path.join(ARCHIVE_DIR, entry["file"]), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    t = json.loads(line)
+                    if subj and t.get('mata_pelajaran', '').lower() != subj:
+                        continue
+                    yield t
+        except Exception:
+            continue
+
+
+def next_task_id(tasks) -> int:
+    """Id untuk tugas baru, unik terhadap tugas aktif maupun arsip."""
+    return max([load_archive_index().get("max_id", 0)] + [t.get('id', 0) for t in tasks]) + 1
+
+
 def log_event(message: str):
     """Tambahkan entri ke LOG.txt dengan timestamp."""
     ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -56,8 +250,8 @@ def log_event(message: str):
             f.write(f"[{ts}] {message}\n")
     except Exception:
         pass
-def display_tasks(tasks):
-    """Menampilkan semua tugas"""
+def display_tasks(tasks, sort_by_deadline=True):
+    """Menampilkan semua tugas (urut deadline kecuali `sort_by_deadline` False)"""
     if not tasks:
         print("\n❌ Tidak ada tugas.\n")
         return
@@ -77,7 +271,7 @@ def display_tasks(tasks):
         except Exception:
             return datetime.max
 
-    sorted_tasks = sorted(tasks, key=_deadline_key)
+    sorted_tasks = sorted(tasks, key=_deadline_key) if sort_by_deadline else tasks
 
     table_data = []
     for i, task in enumerate(sorted_tasks, 1):
@@ -143,7 +337,7 @@ def add_task(tasks):
         pri = "MEDIUM"
 
     task = {
-        "id": len(tasks) + 1,
+        "id": next_task_id(tasks),
         "nama": nama,
         "mata_pelajaran": mata_pelajaran,
         "deadline": deadline,
@@ -259,14 +453,15 @@ def edit_task(tasks):
 
 def search_tasks(tasks):
     """Mencari tugas berdasarkan nama atau mata pelajaran"""
-    if not tasks:
-        print("\n❌ Tidak ada tugas.\n")
-        return
-    
-    
     keyword = input("\nCari berdasarkan nama atau mata pelajaran: ").strip().lower()
-    
-    hasil = [task for task in tasks if keyword in task['nama'].lower() or keyword in task['mata_pelajaran'].lower()]
+    include_archive = input("Sertakan arsip? (y/N): ").strip().lower() == "y"
+
+    def _match(task):
+        return keyword in task.get('nama', '').lower() or keyword in task.get('mata_pelajaran', '').lower()
+
+    hasil = [task for task in tasks if _match(task)]
+    if include_archive:
+        hasil.extend(t for t in iter_archive() if _match(t))
     
     if hasil:
         table_data = []
@@ -274,9 +469,9 @@ def search_tasks(tasks):
             status = "✓ Selesai" if task.get("completed", False) else "⏳ Belum"
             table_data.append([
                 i,
-                task['nama'],
-                task['mata_pelajaran'],
-                task['deadline'],
+                task.get('nama', '(tanpa nama)'),
+                task.get('mata_pelajaran', ''),
+                task.get('deadline', ''),
                 status
             ])
         
@@ -326,6 +521,462 @@ def parse_deadline_string(s: str) -> datetime:
     raise ValueError("Format deadline tidak dikenali")
 
 
+# --- Mesin kolom deadline ---------------------------------------------------
+# Deadline disimpan sebagai epoch (detik) dalam array int64 bersama kolom
+# status/priority/notified, sehingga perhitungan overdue, jendela waktu dan
+# hitungan per-priority dilakukan sekaligus untuk semua tugas.
+
+PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+# Nilai epoch untuk tugas tanpa deadline / deadline tidak valid
+NO_DEADLINE = -1
+
+
+@lru_cache(maxsize=65536)
+def _hour_epoch(year: int, month: int, day: int, hour: int) -> int:
+    """Epoch awal jam tertentu (waktu lokal); di-cache per tanggal+jam."""
+    return int(datetime(year, month, day, hour).timestamp())
+
+
+def _deadline_epoch(s: str) -> int:
+    """Konversi string deadline ke epoch detik (NO_DEADLINE jika tidak valid).
+
+    Format baku (DD-MM-YYYY, DD-MM-YYYY HH:MM, DD-MM-YYYY HH:MM:SS) diurai
+    langsung per posisi karakter tanpa `strptime`; format lain lewat
+    `parse_deadline_string`.
+    """
+    n = len(s)
+    if n in (10, 16, 19) and s[2] == '-' and s[5] == '-':
+        try:
+            if n == 10:
+                hour, minute, second = 23, 59, 59
+            elif (s[10] == ' ' and s[13] == ':' and s[11:13].isdigit() and s[14:16].isdigit()
+                  and (n == 16 or (s[16] == ':' and s[17:19].isdigit()))):
+                hour, minute = int(s[11:13]), int(s[14:16])
+                second = int(s[17:19]) if n == 19 else 0
+            else:
+                raise ValueError
+            if not (s[0:2] + s[3:5] + s[6:10]).isdigit() or minute > 59 or second > 59:
+                raise ValueError
+            return _hour_epoch(int(s[6:10]), int(s[3:5]), int(s[0:2]), hour) + minute * 60 + second
+        except (ValueError, OverflowError, OSError):
+            pass
+    try:
+        return int(parse_deadline_string(s).timestamp())
+    except (ValueError, TypeError, OverflowError, OSError):
+        return NO_DEADLINE
+
+
+def build_deadline_columns(tasks):
+    """Bangun kolom deadline/status/priority/notified dari daftar tugas.
+
+    Mengembalikan dict berisi array NumPy jika tersedia, atau list biasa.
+    """
+    deadline = [_deadline_epoch(t.get('deadline') or '') for t in tasks]
+    completed = [bool(t.get('completed', False)) for t in tasks]
+    late = [t.get('status') == 'TERLAMBAT' for t in tasks]
+    done = [t.get('status') == 'SELESAI' for t in tasks]
+    pri_index = {p: i for i, p in enumerate(PRIORITIES)}
+    # priority di luar PRIORITIES masuk indeks len(PRIORITIES)
+    priority = [pri_index.get(t.get('priority', 'MEDIUM'), len(PRIORITIES)) for t in tasks]
+    notified_1d = [bool(t.get('notified_1d', False)) for t in tasks]
+    notified_1h = [bool(t.get('notified_1h', False)) for t in tasks]
+
+    if np is not None:
+        return {
+            'deadline': np.array(deadline, dtype=np.int64),
+            'completed': np.array(completed, dtype=bool),
+            'late': np.array(late, dtype=bool),
+            'done': np.array(done, dtype=bool),
+            'priority': np.array(priority, dtype=np.int8),
+            'notified_1d': np.array(notified_1d, dtype=bool),
+            'notified_1h': np.array(notified_1h, dtype=bool),
+        }
+    return {
+        'deadline': deadline,
+        'completed': completed,
+        'late': late,
+        'done': done,
+        'priority': priority,
+        'notified_1d': notified_1d,
+        'notified_1h': notified_1h,
+    }
+
+
+def overdue_indices(cols, now: int):
+    """Indeks tugas yang lewat deadline, belum selesai, dan belum TERLAMBAT."""
+    dl = cols['deadline']
+    if np is not None:
+        mask = (dl != NO_DEADLINE) & (dl < now) & ~cols['completed'] & ~cols['late']
+        return np.flatnonzero(mask).tolist()
+    return [i for i, d in enumerate(dl)
+            if d != NO_DEADLINE and d < now and not cols['completed'][i] and not cols['late'][i]]
+
+
+def window_indices(cols, now: int, window_secs: float, flag=None, skip_completed=False):
+    """Tugas dengan sisa waktu 0 < sisa <= `window_secs`.
+
+    - `flag`: nama kolom notified; tugas yang flag-nya sudah True dilewati.
+    - `skip_completed`: lewati tugas yang sudah selesai.
+    Mengembalikan (indeks, sisa_detik) sebagai list.
+    """
+    dl = cols['deadline']
+    if np is not None:
+        remaining = dl - now
+        mask = (dl != NO_DEADLINE) & (remaining > 0) & (remaining <= window_secs)
+        if skip_completed:
+            mask &= ~cols['completed']
+        if flag:
+            mask &= ~cols[flag]
+        idx = np.flatnonzero(mask)
+        return idx.tolist(), remaining[idx].tolist()
+
+    idx, rem = [], []
+    for i, d in enumerate(dl):
+        if d == NO_DEADLINE:
+            continue
+        r = d - now
+        if not (0 < r <= window_secs):
+            continue
+        if skip_completed and cols['completed'][i]:
+            continue
+        if flag and cols[flag][i]:
+            continue
+        idx.append(i)
+        rem.append(r)
+    return idx, rem
+
+
+def split_remaining(remaining):
+    """Pecah sisa detik menjadi (hari, jam, menit, detik) per elemen."""
+    if np is not None:
+        r = np.asarray(remaining, dtype=np.int64)
+        days, r = np.divmod(r, 86400)
+        hours, r = np.divmod(r, 3600)
+        minutes, seconds = np.divmod(r, 60)
+        return list(zip(days.tolist(), hours.tolist(), minutes.tolist(), seconds.tolist()))
+    out = []
+    for r in remaining:
+        days, r = divmod(int(r), 86400)
+        hours, r = divmod(r, 3600)
+        minutes, seconds = divmod(r, 60)
+        out.append((days, hours, minutes, seconds))
+    return out
+
+
+def priority_counts(cols):
+    """Hitung jumlah tugas per priority (HIGH/MEDIUM/LOW)."""
+    pri = cols['priority']
+    if np is not None:
+        counts = np.bincount(pri, minlength=len(PRIORITIES) + 1).tolist()
+    else:
+        counts = [0] * (len(PRIORITIES) + 1)
+        for p in pri:
+            counts[p] += 1
+    return {p: counts[i] for i, p in enumerate(PRIORITIES)}
+
+
+def done_count(cols):
+    """Jumlah tugas berstatus SELESAI."""
+    if np is not None:
+        return int(np.count_nonzero(cols['done']))
+    return sum(cols['done'])
+
+
+# --- Skor prioritas ("apa yang dikerjakan berikutnya") ----------------------
+# Skor = bobot priority + bobot urgensi (bucket sisa waktu) + bonus TERLAMBAT.
+# Tugas SELESAI tidak diberi skor. Skor sebuah tugas hanya berubah ketika sisa
+# waktunya pindah bucket, jadi skor disimpan bersama epoch `valid_until` dan
+# hanya dihitung ulang untuk tugas yang bucket-nya sudah berganti.
+
+# Batas bucket (detik sisa): <0 terlambat, <1 jam, <1 hari, <3 hari, <7 hari, sisanya
+BUCKET_LIMITS = (0, 3600, 86400, 3 * 86400, 7 * 86400)
+# Bobot urgensi per bucket; indeks terakhir untuk tugas tanpa deadline
+URGENCY_WEIGHTS = (10, 8, 6, 4, 2, 1, 0)
+# Bobot per indeks PRIORITIES (HIGH, MEDIUM, LOW) + priority tidak dikenal
+PRIORITY_WEIGHTS = (6, 3, 0, 3)
+LATE_BONUS = 2
+# Jumlah kandidat teratas yang disimpan di cache
+TOP_CACHE_SIZE = 64
+# Batas epoch (2**32) untuk tie-break deadline dalam kunci ranking;
+# deadline di luar rentang ini di-clamp
+_EPOCH_SPAN = 1 << 32
+# Cache ranking di disk untuk `python main.py next`: header kecil (JSON) berisi
+# baris top-k siap tampil, dan data lengkap (kolom + skor) untuk refresh
+# inkremental, sebagai .npz (NumPy) atau JSON (Python murni). Keduanya dibaca
+# tanpa pickle.
+NEXT_CACHE_FILE = ".next_cache.json"
+NEXT_CACHE_NPZ = ".next_cache.npz"
+NEXT_CACHE_DATA_JSON = ".next_cache_data.json"
+
+_SCORE_CACHE = {"cols": None, "stamp": None, "keys": None, "valid_until": None,
+                "next_change": 0, "top": [], "dirty": False}
+
+
+def _score_one(cols, i, now: int):
+    """Hitung (kunci ranking, valid_until) untuk tugas ke-i (Python murni).
+
+    Kunci ranking = skor * 2**32 + tie-break deadline terdekat; -1 untuk tugas selesai.
+    """
+    if cols['completed'][i] or cols['done'][i]:
+        return -1, float('inf')
+    dl = int(cols['deadline'][i])
+    if dl == NO_DEADLINE:
+        bucket, valid_until, tie = len(BUCKET_LIMITS) + 1, float('inf'), 0
+    else:
+        remaining = dl - now
+        bucket = sum(1 for lim in BUCKET_LIMITS if remaining >= lim)
+        # bucket berganti begitu sisa waktu turun di bawah batas bawahnya
+        valid_until = dl - BUCKET_LIMITS[bucket - 1] + 1 if bucket > 0 else float('inf')
+        tie = _EPOCH_SPAN - 1 - min(max(dl, 0), _EPOCH_SPAN - 1)
+    score = URGENCY_WEIGHTS[bucket] + PRIORITY_WEIGHTS[int(cols['priority'][i])]
+    if cols['late'][i]:
+        score += LATE_BONUS
+    return score * _EPOCH_SPAN + tie, valid_until
+
+
+def score_columns(cols, now: int, indices=None):
+    """Hitung kunci ranking dan `valid_until` untuk semua tugas (atau `indices`)."""
+    if np is None:
+        idx = range(len(cols['deadline'])) if indices is None else indices
+        pairs = [_score_one(cols, i, now) for i in idx]
+        return [k for k, _ in pairs], [v for _, v in pairs]
+
+    sel = slice(None) if indices is None else np.asarray(indices, dtype=np.int64)
+    dl = cols['deadline'][sel]
+    has_dl = dl != NO_DEADLINE
+    limits = np.array(BUCKET_LIMITS, dtype=np.int64)
+    bucket = np.searchsorted(limits, dl - now, side='right')
+    bucket = np.where(has_dl, bucket, len(BUCKET_LIMITS) + 1)
+    lower = np.concatenate(([0], limits))[bucket.clip(max=len(BUCKET_LIMITS))]
+    valid_until = np.where(has_dl & (bucket > 0), dl - lower + 1, np.iinfo(np.int64).max)
+
+    score = (np.array(URGENCY_WEIGHTS, dtype=np.int64)[bucket]
+             + np.array(PRIORITY_WEIGHTS, dtype=np.int64)[cols['priority'][sel]]
+             + LATE_BONUS * cols['late'][sel])
+    tie = np.where(has_dl, _EPOCH_SPAN - 1 - np.clip(dl, 0, _EPOCH_SPAN - 1), 0)
+    keys = score * _EPOCH_SPAN + tie
+    finished = cols['completed'][sel] | cols['done'][sel]
+    keys[finished] = -1
+    # tugas selesai tidak pernah perlu dihitung ulang
+    valid_until[finished] = np.iinfo(np.int64).max
+    return keys, valid_until
+
+
+def next_tasks(tasks, n: int = 5, cols=None, now=None, stamp=None):
+    """Kembalikan hingga `n` pasang (tugas, skor) yang paling perlu dikerjakan.
+
+    Ranking dilayani dari heap top-k yang di-cache; skor hanya dihitung ulang
+    untuk tugas yang bucket sisa waktunya sudah berganti. Cache hanya dipakai
+    ulang jika `cols` adalah objek kolom yang sama dengan pemanggilan
+    sebelumnya. Jika `stamp` (penanda tasks.json asal `tasks`) diberikan,
+    ranking juga disimpan ke cache disk untuk `load_next_cached`.
+    """
+    cache = _SCORE_CACHE
+    n = max(1, n)
+    if now is None:
+        now = int(datetime.now().timestamp())
+
+    if cols is None or cols is not cache["cols"]:
+        if cols is None:
+            cols = build_deadline_columns(tasks)
+        keys, valid_until = score_columns(cols, now)
+        ranked = range(len(keys))
+        if np is not None and len(keys) > TOP_CACHE_SIZE:
+            # seleksi kandidat dulu agar heap tidak menyentuh semua tugas
+            ranked = np.argpartition(keys, -TOP_CACHE_SIZE)[-TOP_CACHE_SIZE:].tolist()
+        cache.update(cols=cols, stamp=stamp, keys=keys, valid_until=valid_until)
+    elif now >= cache["next_change"] or n > TOP_CACHE_SIZE:
+        keys, valid_until = cache["keys"], cache["valid_until"]
+        if np is not None:
+            stale = np.flatnonzero(valid_until <= now).tolist()
+        else:
+            stale = [i for i, v in enumerate(valid_until) if v <= now]
+        new_keys, new_valid = score_columns(cols, now, stale)
+        for j, i in enumerate(stale):
+            keys[i] = new_keys[j]
+            valid_until[i] = new_valid[j]
+        # Skor hanya naik saat bucket berganti, jadi kandidat baru cukup
+        # diambil dari top lama + tugas yang dihitung ulang
+        ranked = set(cache["top"]) | set(stale)
+    else:
+        ranked = None
+
+    if ranked is not None:
+        keys = cache["keys"]
+        cache["top"] = heapq.nlargest(TOP_CACHE_SIZE, (i for i in ranked if keys[i] >= 0),
+                                      key=keys.__getitem__)
+        cache["next_change"] = _top_valid_until(cols, keys, cache["valid_until"], cache["top"])
+        cache["dirty"] = True
+
+    if cache["dirty"] and cache["stamp"] is not None:
+        _save_next_cache(tasks)
+
+    if n > TOP_CACHE_SIZE:
+        keys = cache["keys"]
+        top = heapq.nlargest(n, (i for i in range(len(keys)) if keys[i] >= 0), key=keys.__getitem__)
+    else:
+        top = cache["top"][:n]
+    return [(tasks[i], int(cache["keys"][i]) // _EPOCH_SPAN) for i in top]
+
+
+def _invalidate_scores(cols):
+    """Buang ranking yang di-cache jika dibangun dari `cols`.
+
+    Dipanggil setelah kolom ditulis in-place (mis. status TERLAMBAT), karena
+    skor yang tersimpan tidak lagi sesuai isi kolom.
+    """
+    if _SCORE_CACHE["cols"] is cols:
+        _SCORE_CACHE["cols"] = None
+
+
+def _top_valid_until(cols, keys, valid_until, top):
+    """Epoch paling awal di mana isi/urutan top-k bisa berubah.
+
+    Yaitu saat salah satu tugas di top pindah bucket, atau saat tugas lain
+    masuk bucket yang membuat kuncinya melewati kunci terendah di top.
+    Tugas di luar top yang bucket-nya berganti sebelum itu tetap ditandai
+    lewat `valid_until` dan dihitung ulang pada refresh berikutnya.
+    """
+    inf = float('inf')
+    t_top = min((valid_until[i] for i in top), default=inf)
+    # nilai dari array NumPy dijadikan int biasa agar bisa disimpan ke JSON
+    t_top = int(t_top) if t_top != inf else inf
+    if len(top) < TOP_CACHE_SIZE:
+        # top sudah memuat semua tugas yang belum selesai
+        return t_top
+    threshold = int(keys[top[-1]])
+    n_limits = len(BUCKET_LIMITS)
+
+    if np is None:
+        in_top = set(top)
+        t_enter = inf
+        for i, k in enumerate(keys):
+            dl = cols['deadline'][i]
+            if k < 0 or i in in_top or dl == NO_DEADLINE:
+                continue
+            base = k % _EPOCH_SPAN + _EPOCH_SPAN * (PRIORITY_WEIGHTS[cols['priority'][i]]
+                                                    + LATE_BONUS * bool(cols['late'][i]))
+            # bucket b (0..n_limits-1) dimasuki saat sisa waktu < BUCKET_LIMITS[b];
+            # cari bucket terjauh (paling awal dimasuki) yang melewati threshold
+            for b in range(n_limits - 1, -1, -1):
+                if base + URGENCY_WEIGHTS[b] * _EPOCH_SPAN > threshold:
+                    t_enter = min(t_enter, dl - BUCKET_LIMITS[b] + 1)
+                    break
+        return min(t_top, t_enter)
+
+    mask = (keys >= 0) & (cols['deadline'] != NO_DEADLINE)
+    mask[np.asarray(top, dtype=np.int64)] = False
+    idx = np.flatnonzero(mask)
+    if not len(idx):
+        return t_top
+    dl = cols['deadline'][idx]
+    base = (keys[idx] % _EPOCH_SPAN
+            + _EPOCH_SPAN * (np.array(PRIORITY_WEIGHTS, dtype=np.int64)[cols['priority'][idx]]
+                             + LATE_BONUS * cols['late'][idx]))
+    urgency = np.array(URGENCY_WEIGHTS[:n_limits], dtype=np.int64) * _EPOCH_SPAN
+    # URGENCY_WEIGHTS menurun, jadi bucket yang melewati threshold adalah 0..cnt-1
+    cnt = np.count_nonzero(base[:, None] + urgency[None, :] > threshold, axis=1)
+    reach = cnt > 0
+    if not np.any(reach):
+        return t_top
+    limits = np.array(BUCKET_LIMITS, dtype=np.int64)
+    t_enter = int((dl[reach] - limits[cnt[reach] - 1] + 1).min())
+    return min(t_top, t_enter)
+
+
+def _write_next_data(stamp):
+    """Tulis kolom dan skor `_SCORE_CACHE` ke file data cache."""
+    cache = _SCORE_CACHE
+    if np is not None:
+        arrays = {f"col_{name}": col for name, col in cache["cols"].items()}
+        arrays.update(keys=cache["keys"], valid_until=cache["valid_until"],
+                      top=np.array(cache["top"], dtype=np.int64), stamp=np.array(stamp, dtype=np.int64))
+        with open(NEXT_CACHE_NPZ + ".tmp", 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(NEXT_CACHE_NPZ + ".tmp", NEXT_CACHE_NPZ)
+        return
+    data = {key: cache[key] for key in ("cols", "keys", "valid_until", "top")}
+    data["stamp"] = stamp
+    with open(NEXT_CACHE_DATA_JSON + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(NEXT_CACHE_DATA_JSON + ".tmp", NEXT_CACHE_DATA_JSON)
+
+
+def _read_next_data(stamp):
+    """Baca file data cache; None jika tidak ada atau bukan untuk `stamp`."""
+    try:
+        if np is not None:
+            with np.load(NEXT_CACHE_NPZ, allow_pickle=False) as z:
+                if z["stamp"].tolist() != stamp:
+                    return None
+                return {
+                    "cols": {name[4:]: z[name] for name in z.files if name.startswith("col_")},
+                    "keys": z["keys"],
+                    "valid_until": z["valid_until"],
+                    "top": z["top"].tolist(),
+                }
+        with open(NEXT_CACHE_DATA_JSON, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if data.get("stamp") == stamp else None
+    except Exception:
+        return None
+
+
+def _save_next_cache(tasks):
+    """Simpan ranking di `_SCORE_CACHE` ke disk (data lengkap dulu, lalu header)."""
+    cache = _SCORE_CACHE
+    stamp = list(cache["stamp"])
+    try:
+        _write_next_data(stamp)
+        header = {
+            "stamp": stamp,
+            "next_change": cache["next_change"],
+            # top berisi semua kandidat jika kurang dari TOP_CACHE_SIZE
+            "complete": len(cache["top"]) < TOP_CACHE_SIZE,
+            "top": [{"task": tasks[i], "score": int(cache["keys"][i]) // _EPOCH_SPAN} for i in cache["top"]],
+        }
+        with open(NEXT_CACHE_FILE + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(header, f, ensure_ascii=False)
+        os.replace(NEXT_CACHE_FILE + ".tmp", NEXT_CACHE_FILE)
+    except Exception:
+        return
+    cache["dirty"] = False
+
+
+def load_next_cached(n: int = 5, now=None):
+    """Ranking untuk `python main.py next` memakai cache disk.
+
+    - Jika tasks.json tidak berubah dan belum ada tugas yang pindah bucket,
+      hasil diambil langsung dari header tanpa membaca tasks.json.
+    - Jika hanya waktu yang berjalan, kolom dan skor dimuat dari cache dan
+      hanya tugas yang bucket-nya berganti yang dihitung ulang.
+    - Selain itu ranking dibangun ulang dari tasks.json.
+    """
+    n = max(1, n)
+    if now is None:
+        now = int(datetime.now().timestamp())
+    stamp = _store_stamp()
+    if stamp is None:
+        return []
+
+    try:
+        with open(NEXT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+    except Exception:
+        header = None
+    if header and header.get("stamp") == list(stamp):
+        if now < header["next_change"] and (n <= len(header["top"]) or header["complete"]):
+            return [(row["task"], row["score"]) for row in header["top"][:n]]
+        data = _read_next_data(list(stamp))
+        if data:
+            _SCORE_CACHE.update(cols=data["cols"], stamp=stamp, keys=data["keys"],
+                                valid_until=data["valid_until"], next_change=header["next_change"],
+                                top=data["top"], dirty=False)
+            return next_tasks(load_tasks(), n, data["cols"], now, stamp)
+
+    return next_tasks(load_tasks(), n, now=now, stamp=stamp)
+
+
 def start_countdown_for_task(task):
     """Mulai thread hitung mundur untuk `task` jika deadline memiliki waktu spesifik.
 
@@ -345,16 +996,7 @@ def start_countdown_for_task(task):
     def worker(name, seconds, task_id):
         try:
             time.sleep(seconds)
-            # reload tasks to check status
-            tasks = load_tasks()
-            # find task by id and ensure not completed
-            for t in tasks:
-                if t.get("id") == task_id:
-                    if not t.get("completed", False):
-                        _alarm_notify(f"⏰ ALARM! '{name}' deadline tercapai")
-                        t["status"] = "TERLAMBAT"
-                        save_tasks(tasks)
-                    break
+            _deadline_reached(name, task_id)
         except Exception:
             pass
 
@@ -362,6 +1004,28 @@ def start_countdown_for_task(task):
     th.start()
 
 
+def _deadline_reached(name, task_id):
+    """Tandai tugas `task_id` TERLAMBAT saat countdown habis, lalu bunyikan alarm.
+
+    Load -> ubah -> simpan dilakukan di dalam `_STORE_LOCK`; alarm dibunyikan
+    setelah lock dilepas.
+    """
+    due = False
+    with _STORE_LOCK:
+        # reload tasks to check status
+        tasks = load_tasks()
+        # find task by id and ensure not completed
+        for t in tasks:
+            if t.get("id") == task_id:
+                if not t.get("completed", False):
+                    t["status"] = "TERLAMBAT"
+                    save_tasks(tasks)
+                    due = True
+                break
+    if due:
+        _alarm_notify(f"⏰ ALARM! '{name}' deadline tercapai")
+
+
 def start_countdowns_for_all_tasks(tasks):
     """Mulai countdown background untuk semua tugas yang memiliki waktu spesifik pada deadline."""
     for task in tasks:
@@ -436,44 +1100,29 @@ def countdown_alarm(tasks=None):
         return
 
 
-def check_upcoming_deadlines(tasks, threshold_days: float = 1.0):
+def check_upcoming_deadlines(tasks, threshold_days: float = 1.0, cols=None):
     """Tampilkan peringatan untuk tugas yang mendekati deadline.
 
     - `threshold_days` dapat berupa pecahan (contoh 0.5 = 12 jam).
-    - Deadline tugas disimpan sebagai DD-MM-YYYY; dianggap berakhir pada 23:59:59 hari itu.
+    - Deadline tanpa waktu dianggap berakhir pada 23:59:59 hari itu.
+    - `cols` (opsional) hasil `build_deadline_columns(tasks)` agar tidak dibangun ulang.
     """
     if not tasks:
         return
 
-    now = datetime.now()
-    threshold = timedelta(days=threshold_days)
+    if cols is None:
+        cols = build_deadline_columns(tasks)
+    now = int(datetime.now().timestamp())
+    threshold = timedelta(days=threshold_days).total_seconds()
     alerts = []
 
-    for task in tasks:
-        dl = task.get("deadline")
-        if not dl:
-            continue
-        try:
-            d = datetime.strptime(dl, "%d-%m-%Y")
-            deadline_dt = datetime(d.year, d.month, d.day, 23, 59, 59)
-            delta = deadline_dt - now
-            if delta.total_seconds() > 0 and delta <= threshold:
-                secs = int(delta.total_seconds())
-                days = secs // 86400
-                rem = secs % 86400
-                hours = rem // 3600
-                rem = rem % 3600
-                minutes = rem // 60
-                seconds = rem % 60
-
-                if days > 0:
-                    rem_str = f"{days}d {hours:02}:{minutes:02}:{seconds:02}"
-                else:
-                    rem_str = f"{hours:02}:{minutes:02}:{seconds:02}"
-
-                alerts.append((task.get("nama", "(tanpa nama)"), rem_str))
-        except Exception:
-            continue
+    idx, remaining = window_indices(cols, now, threshold)
+    for i, (days, hours, minutes, seconds) in zip(idx, split_remaining(remaining)):
+        if days > 0:
+            rem_str = f"{days}d {hours:02}:{minutes:02}:{seconds:02}"
+        else:
+            rem_str = f"{hours:02}:{minutes:02}:{seconds:02}"
+        alerts.append((tasks[i].get("nama", "(tanpa nama)"), rem_str))
 
     if alerts:
         # Trigger a short alarm/notification
@@ -485,71 +1134,77 @@ def check_upcoming_deadlines(tasks, threshold_days: float = 1.0):
         print()
 
 
-def update_overdue_statuses(tasks):
+def update_overdue_statuses(tasks, cols=None):
     """Tandai tugas yang lewat deadline sebagai TERLAMBAT dan simpan perubahan."""
+    if cols is None:
+        cols = build_deadline_columns(tasks)
     changed = False
-    now = datetime.now()
-    for task in tasks:
-        try:
-            dl = task.get("deadline")
-            if not dl:
-                continue
-            d = datetime.strptime(dl, "%d-%m-%Y")
-            deadline_dt = datetime(d.year, d.month, d.day, 23, 59, 59)
-            if now > deadline_dt and not task.get("completed", False) and task.get("status") != "TERLAMBAT":
-                task["status"] = "TERLAMBAT"
-                changed = True
-                msg = f"Tugas \"{task.get('nama', '(tanpa nama)')}\" TERLAMBAT"
-                print(f"[!] {msg}")
-                log_event(msg)
-        except Exception:
-            continue
+    now = int(datetime.now().timestamp())
+    for i in overdue_indices(cols, now):
+        task = tasks[i]
+        task["status"] = "TERLAMBAT"
+        cols['late'][i] = True
+        changed = True
+        msg = f"Tugas \"{task.get('nama', '(tanpa nama)')}\" TERLAMBAT"
+        print(f"[!] {msg}")
+        log_event(msg)
 
     if changed:
+        _invalidate_scores(cols)
         save_tasks(tasks)
 
 
-def notify_time_based(tasks):
+def notify_time_based(tasks, cols=None):
     """Kirim notifikasi 1 hari dan 1 jam sebelum deadline (satu kali per task).
 
     Menandai `notified_1d` dan `notified_1h` agar tidak mengulang.
     """
-    now = datetime.now()
+    if cols is None:
+        cols = build_deadline_columns(tasks)
+    now = int(datetime.now().timestamp())
     changed = False
-    for task in tasks:
-        if task.get("completed", False):
-            continue
-        try:
-            dl = task.get("deadline")
-            if not dl:
-                continue
-            d = datetime.strptime(dl, "%d-%m-%Y")
-            deadline_dt = datetime(d.year, d.month, d.day, 23, 59, 59)
-            delta = (deadline_dt - now).total_seconds()
-            # 1 day = 86400 seconds, 1 hour = 3600 seconds
-            if 0 < delta <= 86400 and not task.get("notified_1d", False):
-                msg = f"🔔 Reminder: Tugas \"{task.get('nama')}\" 1 hari lagi"
-                _alarm_notify(msg)
-                task["notified_1d"] = True
-                changed = True
-                log_event(f"Reminder 1 hari: {task.get('nama')} (deadline: {task.get('deadline')})")
-            if 0 < delta <= 3600 and not task.get("notified_1h", False):
-                msg = f"🔔 Reminder: Tugas \"{task.get('nama')}\" 1 jam lagi"
-                _alarm_notify(msg)
-                task["notified_1h"] = True
-                changed = True
-                log_event(f"Reminder 1 jam: {task.get('nama')} (deadline: {task.get('deadline')})")
-        except Exception:
-            continue
+    # 1 day = 86400 seconds, 1 hour = 3600 seconds
+    idx_1d, _ = window_indices(cols, now, 86400, flag='notified_1d', skip_completed=True)
+    idx_1h, _ = window_indices(cols, now, 3600, flag='notified_1h', skip_completed=True)
+    for i in idx_1d:
+        task = tasks[i]
+        msg = f"🔔 Reminder: Tugas \"{task.get('nama')}\" 1 hari lagi"
+        _alarm_notify(msg)
+        task["notified_1d"] = True
+        cols['notified_1d'][i] = True
+        changed = True
+        log_event(f"Reminder 1 hari: {task.get('nama')} (deadline: {task.get('deadline')})")
+    for i in idx_1h:
+        task = tasks[i]
+        msg = f"🔔 Reminder: Tugas \"{task.get('nama')}\" 1 jam lagi"
+        _alarm_notify(msg)
+        task["notified_1h"] = True
+        cols['notified_1h'][i] = True
+        changed = True
+        log_event(f"Reminder 1 jam: {task.get('nama')} (deadline: {task.get('deadline')})")
 
     if changed:
+        _invalidate_scores(cols)
         save_tasks(tasks)
 
 
-def show_stats(tasks):
-    """Tampilkan statistik sederhana: total, selesai, persentase, dan progress bar."""
+def show_stats(tasks, cols=None, include_archive=False):
+    """Tampilkan statistik sederhana: total, selesai, persentase, dan progress bar.
+
+    Jika `include_archive` True, hitungan dari index arsip ikut dijumlahkan
+    (export CSV tetap hanya berisi tugas aktif).
+    """
+    if cols is None:
+        cols = build_deadline_columns(tasks)
     total = len(tasks)
-    done = sum(1 for t in tasks if t.get('status') == 'SELESAI')
+    done = done_count(cols)
+    pri_counts = priority_counts(cols)
+    if include_archive:
+        a_total, a_done, a_pri = archive_stats()
+        total += a_total
+        done += a_done
+        for p, c in a_pri.items():
+            pri_counts[p] = pri_counts.get(p, 0) + c
     pct = int((done / total) * 100) if total > 0 else 0
     # bigger ASCII bar (20 blocks)
     filled = int(pct / 5)
@@ -558,11 +1213,6 @@ def show_stats(tasks):
     print(f"Selesai: {done} / {total} tugas\n")
 
     # breakdown by priority
-    pri_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    for t in tasks:
-        p = t.get('priority', 'MEDIUM')
-        pri_counts[p] = pri_counts.get(p, 0) + 1
-
     print("By Priority:")
     for p in ("HIGH", "MEDIUM", "LOW"):
         print(f" - {p}: {pri_counts.get(p,0)}")
@@ -578,6 +1228,36 @@ def show_stats(tasks):
         pass
 
 
+def show_history():
+    """Tampilkan riwayat tugas dari arsip, difilter per bulan / mata pelajaran."""
+    index = load_archive_index()
+    if not index.get("segments"):
+        print("\nArsip masih kosong.\n")
+        return
+
+    since = input("Dari bulan (YYYY-MM, kosong = semua): ").strip() or None
+    until = input("Sampai bulan (YYYY-MM, kosong = semua): ").strip() or None
+    subject = input("Mata pelajaran (kosong = semua): ").strip() or None
+
+    table_data = []
+    for i, task in enumerate(iter_archive(since, until, subject), 1):
+        table_data.append([
+            i,
+            task.get('nama', '(tanpa nama)'),
+            task.get('mata_pelajaran', ''),
+            task.get('deadline', ''),
+            task.get('priority', 'MEDIUM'),
+            task.get('status', 'BELUM')
+        ])
+
+    if not table_data:
+        print("\n❌ Tidak ada tugas di arsip yang cocok.\n")
+        return
+    headers = ["NO", "TUGAS", "MATA PELAJARAN", "DEADLINE", "PRIORITY", "STATUS"]
+    print("\n" + tabulate(table_data, headers=headers, tablefmt="grid", stralign="left"))
+    print()
+
+
 def view_log(lines: int = 50):
     """Tampilkan log aktivitas terakhir (default 50 baris)."""
     if not os.path.exists('LOG.txt'):
@@ -594,7 +1274,7 @@ def view_log(lines: int = 50):
 
 
 def filter_sort_tasks(tasks):
-    """Filter dan sort tugas berdasarkan priority / deadline / status."""
+    """Filter dan sort tugas berdasarkan priority / deadline / status / skor."""
     if not tasks:
         print("\nTidak ada tugas.\n")
         return
@@ -605,9 +1285,9 @@ def filter_sort_tasks(tasks):
         print("⚠️ Filter tidak valid, menggunakan ALL")
         f = "ALL"
 
-    print("Sort by: (deadline/status/priority)")
+    print("Sort by: (deadline/status/priority/score)")
     s = input("Pilih sort [deadline]: ").strip().lower() or "deadline"
-    if s not in ("deadline", "status", "priority"):
+    if s not in ("deadline", "status", "priority", "score"):
         print("⚠️ Sort tidak valid, menggunakan deadline")
         s = "deadline"
 
@@ -620,10 +1300,47 @@ def filter_sort_tasks(tasks):
             except Exception:
                 return datetime.max
         filtered.sort(key=_key)
+    elif s == "priority":
+        # HIGH > MEDIUM > LOW, bukan urutan alfabet
+        order = {p: i for i, p in enumerate(PRIORITIES)}
+        filtered.sort(key=lambda x: order.get(x.get('priority', 'MEDIUM'), len(PRIORITIES)))
+    elif s == "score":
+        keys, _ = score_columns(build_deadline_columns(filtered), int(datetime.now().timestamp()))
+        keys = [int(k) for k in keys]
+        filtered = [t for _, t in sorted(zip(keys, filtered), key=lambda kt: kt[0], reverse=True)]
     else:
         filtered.sort(key=lambda x: x.get(s, ""))
 
-    display_tasks(filtered)
+    display_tasks(filtered, sort_by_deadline=False)
+
+
+def show_next(tasks=None, n: int = 5, cols=None, stamp=None):
+    """Tampilkan `n` tugas yang paling perlu dikerjakan berikutnya.
+
+    Tanpa `tasks`, ranking diambil lewat cache disk (`load_next_cached`).
+    """
+    if tasks is None:
+        ranked = load_next_cached(n)
+    else:
+        ranked = next_tasks(tasks, n, cols, stamp=stamp)
+    if not ranked:
+        print("\n✅ Tidak ada tugas yang perlu dikerjakan.\n")
+        return
+
+    table_data = []
+    for i, (task, score) in enumerate(ranked, 1):
+        table_data.append([
+            i,
+            task.get('nama', '(tanpa nama)'),
+            task.get('mata_pelajaran', ''),
+            task.get('deadline', ''),
+            task.get('priority', 'MEDIUM'),
+            score
+        ])
+
+    headers = ["NO", "TUGAS", "MATA PELAJARAN", "DEADLINE", "PRIORITY", "SKOR"]
+    print("\n" + tabulate(table_data, headers=headers, tablefmt="grid", stralign="left"))
+    print()
 
 def main():
     """Fungsi utama aplikasi"""
@@ -632,12 +1349,16 @@ def main():
     print("="*80)
     
     while True:
-        tasks = load_tasks()
+        # Tugas dan kolom deadline hanya dimuat ulang jika tasks.json berubah
+        tasks, cols = load_tasks_cached()
         # Perbarui status TERLAMBAT otomatis dan kirim notifikasi time-based
-        update_overdue_statuses(tasks)
-        notify_time_based(tasks)
+        update_overdue_statuses(tasks, cols)
+        notify_time_based(tasks, cols)
         # Tampilkan peringatan tugas yang mendekati deadline (default 1 hari)
-        check_upcoming_deadlines(tasks, threshold_days=1.0)
+        check_upcoming_deadlines(tasks, threshold_days=1.0, cols=cols)
+        # Arsipkan tugas SELESAI yang sudah lama (setelah status diperbarui)
+        if archive_old_tasks(tasks, cols):
+            tasks, cols = load_tasks_cached()
         
         print("\n\033[1m📋 MENU UTAMA\033[0m")
         print("1. Tampilkan semua tugas")
@@ -652,9 +1373,11 @@ def main():
         print("10. Filter/Sort tugas")
         print("11. Statistik tugas")
         print("12. Lihat log aktivitas")
-        print("13. Keluar")
+        print("13. Riwayat tugas (arsip)")
+        print("14. Kerjakan berikutnya (next)")
+        print("15. Keluar")
 
-        pilihan = input("\nPilih menu (1-13): ").strip()
+        pilihan = input("\nPilih menu (1-15): ").strip()
         
         if pilihan == "1":
             display_tasks(tasks)
@@ -706,14 +1429,36 @@ def main():
         elif pilihan == "10":
             filter_sort_tasks(tasks)
         elif pilihan == "11":
-            show_stats(tasks)
+            include_archive = input("Sertakan arsip? (y/N): ").strip().lower() == "y"
+            show_stats(tasks, include_archive=include_archive)
         elif pilihan == "12":
             view_log()
         elif pilihan == "13":
+            show_history()
+        elif pilihan == "14":
+            try:
+                n = max(1, int(input("Jumlah tugas (default 5): ").strip() or "5"))
+            except ValueError:
+                n = 5
+            show_next(tasks, n, cols, _STORE_CACHE["stamp"])
+        elif pilihan == "15":
             print("\n👋 Terima kasih telah menggunakan aplikasi To-Do List!\n")
             break
         else:
-            print("\n❌ Pilihan tidak valid! Silakan pilih menu 1-13.\n")
+            print("\n❌ Pilihan tidak valid! Silakan pilih menu 1-15.\n")
+
+        # Menu yang mengubah tugas bisa berhenti di tengah tanpa menyimpan
+        # (mis. edit dengan deadline tidak valid); muat ulang dari file
+        if pilihan in ("2", "3", "4", "5"):
+            _STORE_CACHE["stamp"] = None
 
 if __name__ == "__main__":
-    main()
+    # `python main.py next [N]` langsung menampilkan N tugas berikutnya
+    if len(sys.argv) > 1 and sys.argv[1] == "next":
+        try:
+            n = max(1, int(sys.argv[2])) if len(sys.argv) > 2 else 5
+        except ValueError:
+            n = 5
+        show_next(n=n)
+    else:
+        main()
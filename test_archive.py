@@ -0,0 +1,101 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import main
+from conftest import make_task
+
+
+def test_archive_round_trip():
+    main.save_tasks([
+        make_task(1, "10-01-2020", "SELESAI", subject="Fisika"),
+        make_task(2, "20-01-2020", "SELESAI", "HIGH", subject="kimia"),
+        make_task(3, "05-03-2021", "SELESAI", subject="fisika"),
+        make_task(4, "15-01-2020", "TERLAMBAT"),
+        make_task(7, "01-01-2099"),
+    ])
+    tasks = main.load_tasks()
+
+    assert main.archive_old_tasks(tasks) == 3
+    hot = main.load_tasks()
+    assert [t["id"] for t in hot] == [4, 7]
+
+    assert sorted(t["id"] for t in main.iter_archive()) == [1, 2, 3]
+    assert [t["id"] for t in main.iter_archive(since="2020-01", until="2020-12")] == [1, 2]
+    assert [t["id"] for t in main.iter_archive(since="2021-01")] == [3]
+    assert sorted(t["id"] for t in main.iter_archive(subject="FISIKA")) == [1, 3]
+    assert list(main.iter_archive(subject="biologi")) == []
+
+    assert main.next_task_id(hot) == 8
+    assert main.next_task_id([]) == 8
+
+
+def test_archive_keeps_unfinished_and_recent_tasks():
+    now = datetime.now()
+    recent = (now - timedelta(days=main.ARCHIVE_AFTER_DAYS - 1)).strftime("%d-%m-%Y")
+    main.save_tasks([make_task(1, recent, "SELESAI"), make_task(2, "01-01-2020", "TERLAMBAT")])
+
+    assert main.archive_old_tasks(main.load_tasks()) == 0
+    assert len(main.load_tasks()) == 2
+    assert list(main.iter_archive()) == []
+
+
+def test_archive_waits_for_countdown_worker(monkeypatch):
+    main.save_tasks([make_task(1, "01-01-2020", "SELESAI"), make_task(9, "01-01-2099")])
+    monkeypatch.setattr(main, "_alarm_notify", lambda message: None)
+    load_tasks = main.load_tasks
+
+    def slow_load_tasks():
+        # perlebar jendela antara baca dan simpan agar kedua thread tumpang tindih
+        tasks = load_tasks()
+        time.sleep(0.1)
+        return tasks
+
+    monkeypatch.setattr(main, "load_tasks", slow_load_tasks)
+    worker = threading.Thread(target=main._deadline_reached, args=("tugas 9", 9))
+    worker.start()
+    time.sleep(0.03)
+    archiver = threading.Thread(target=main.archive_old_tasks, args=(load_tasks(),))
+    archiver.start()
+    worker.join()
+    archiver.join()
+
+    assert [(t["id"], t["status"]) for t in load_tasks()] == [(9, "TERLAMBAT")]
+    assert [t["id"] for t in main.iter_archive()] == [1]
+
+
+def test_stats_include_archive_counts_from_index(capsys):
+    main.save_tasks([make_task(1, "01-01-2020", "SELESAI", "HIGH"), make_task(2, "01-01-2099", priority="LOW")])
+    main.archive_old_tasks(main.load_tasks())
+    tasks = main.load_tasks()
+
+    main.show_stats(tasks, include_archive=True)
+    out = capsys.readouterr().out
+    assert "Selesai: 1 / 2 tugas" in out
+    assert " - HIGH: 1" in out
+    with open("progress.csv", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 2
+
+
+def test_archive_skips_malformed_deadlines():
+    main.save_tasks([
+        make_task(1, "01-01-2020 10:-1", "SELESAI"),
+        make_task(2, "01-01-2020 +1:00", "SELESAI"),
+        make_task(3, "01-01-2020 10:05", "SELESAI"),
+    ])
+
+    assert main.archive_old_tasks(main.load_tasks()) == 1
+    assert [t["id"] for t in main.load_tasks()] == [1, 2]
+    assert [t["id"] for t in main.iter_archive(since="2020-01", until="2020-01")] == [3]
+
+
+def test_search_includes_archived_rows_missing_fields(monkeypatch, capsys):
+    old = make_task(1, "01-01-2020", "SELESAI")
+    del old["mata_pelajaran"]
+    main.save_tasks([old, make_task(2, "01-01-2099")])
+    main.archive_old_tasks(main.load_tasks())
+
+    answers = iter(["tugas 1", "y"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    main.search_tasks(main.load_tasks())
+    assert "tugas 1" in capsys.readouterr().out
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+import main
+from conftest import random_tasks
+
+
+def test_deadline_epoch_matches_parse_deadline_string():
+    for s in ["28-01-2026", "28-01-2026 10:05", "28-01-2026 10:05:09", "1-2-2026",
+              "31-02-2026", "28-01-2026 24:00", "28-01-2026 10:60", "", "x",
+              "01-01-2025 +1:00", "01-01-2025 1 :00", "01-01-2025 10:-1", "01-01-2025 10:05:-1",
+              "01-01-2025 10:05: 1", "01-01-2025 10:+5", "01-01-2025 10:05:60", "01-01-2025 1005:00"]:
+        try:
+            expected = int(main.parse_deadline_string(s).timestamp())
+        except ValueError:
+            expected = main.NO_DEADLINE
+        assert main._deadline_epoch(s) == expected, s
+
+
+def test_column_backends_agree(monkeypatch):
+    np = pytest.importorskip("numpy")
+    now_dt = datetime.now()
+    now = int(now_dt.timestamp())
+    tasks = random_tasks(500, 1, now_dt)
+
+    def run():
+        cols = main.build_deadline_columns(tasks)
+        keys, valid_until = main.score_columns(cols, now)
+        return (
+            main.overdue_indices(cols, now),
+            main.window_indices(cols, now, 86400),
+            main.window_indices(cols, now, 3600, flag="notified_1h", skip_completed=True),
+            main.window_indices(cols, now, 86400, flag="notified_1d", skip_completed=True),
+            main.priority_counts(cols),
+            main.done_count(cols),
+            [int(k) for k in keys],
+            [int(v) if v != float("inf") else None for v in valid_until],
+        )
+
+    with_numpy = run()
+    monkeypatch.setattr(main, "np", None)
+    pure = run()
+    # valid_until "tak terhingga" berbeda representasi per backend
+    big = np.iinfo(np.int64).max
+    with_numpy = with_numpy[:-1] + ([None if v == big else v for v in with_numpy[-1]],)
+    assert with_numpy == pure
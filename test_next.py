@@ -0,0 +1,99 @@
+import json
+import random
+from datetime import datetime, timedelta
+
+import main
+from conftest import make_task, random_tasks
+
+
+def _full_rank(cols, now, n):
+    keys, _ = main.score_columns(cols, now)
+    return sorted((int(k) for k in keys if k >= 0), reverse=True)[:n]
+
+
+def test_next_tasks_incremental_matches_full_rank(backend):
+    now_dt = datetime.now()
+    now = int(now_dt.timestamp())
+    tasks = random_tasks(400, 2, now_dt)
+    cols = main.build_deadline_columns(tasks)
+    rnd = random.Random(3)
+
+    for _ in range(200):
+        now += rnd.randint(1, 6 * 3600)
+        ranked = main.next_tasks(tasks, 10, cols, now)
+        expected = _full_rank(cols, now, 10)
+        assert [score for _, score in ranked] == [k // main._EPOCH_SPAN for k in expected]
+        top = main._SCORE_CACHE["top"][:10]
+        assert [int(k) for k in main.score_columns(cols, now, top)[0]] == expected
+
+
+def test_next_tasks_far_deadline_and_n_bounds(backend):
+    now = int(datetime.now().timestamp())
+    tasks = [make_task(1, "01-01-2200", priority="HIGH"), make_task(2, "01-01-2300", priority="LOW")]
+
+    ranked = main.next_tasks(tasks, 5, now=now)
+    assert [(t["id"], score) for t, score in ranked] == [(1, 7), (2, 1)]
+    assert len(main.next_tasks(tasks, -3, now=now)) == 1
+
+
+def test_load_next_cached_uses_disk_cache(backend):
+    now_dt = datetime.now()
+    now = int(now_dt.timestamp())
+    main.save_tasks(random_tasks(200, 4, now_dt))
+
+    first = main.load_next_cached(5, now)
+    with open(main.NEXT_CACHE_FILE, encoding="utf-8") as f:
+        assert len(json.load(f)["top"]) > 0
+    # Jalur header tidak membaca tasks.json sama sekali
+    main._SCORE_CACHE.update(cols=None)
+    assert main.load_next_cached(5, now) == first
+
+    later = now + 3 * 86400
+    main._SCORE_CACHE.update(cols=None)
+    ranked = main.load_next_cached(5, later)
+    cols = main.build_deadline_columns(main.load_tasks())
+    assert [score for _, score in ranked] == [k // main._EPOCH_SPAN for k in _full_rank(cols, later, 5)]
+
+
+def test_load_next_cached_small_store(backend):
+    now = int(datetime.now().timestamp())
+    main.save_tasks([make_task(1, "01-01-2099", priority="HIGH"), make_task(2, "01-01-2099", "SELESAI")])
+
+    ranked = main.load_next_cached(5, now)
+    assert [t["id"] for t, _ in ranked] == [1]
+    with open(main.NEXT_CACHE_FILE, encoding="utf-8") as f:
+        assert json.load(f)["complete"] is True
+
+
+def test_next_tasks_sees_tasks_marked_late(backend, monkeypatch):
+    monkeypatch.setattr(main, "log_event", lambda message: None)
+    now_dt = datetime.now()
+    fmt = "%d-%m-%Y %H:%M:%S"
+    tasks = [make_task(i, (now_dt + timedelta(seconds=1000)).strftime(fmt), priority="HIGH") for i in range(70)]
+    tasks.append(make_task(99, (now_dt + timedelta(seconds=10)).strftime(fmt)))
+    cols = main.build_deadline_columns(tasks)
+    now = int(now_dt.timestamp())
+    main.next_tasks(tasks, 3, cols, now)
+
+    monkeypatch.setattr(main, "datetime", type("FakeDatetime", (datetime,), {
+        "now": classmethod(lambda cls: now_dt + timedelta(seconds=20))}))
+    main.update_overdue_statuses(tasks, cols)
+    assert tasks[-1]["status"] == "TERLAMBAT"
+
+    ranked = main.next_tasks(tasks, 3, cols, now + 20)
+    assert [t["id"] for t, _ in ranked][0] == 99
+    assert [score for _, score in ranked] == [k // main._EPOCH_SPAN for k in _full_rank(cols, now + 20, 3)]
+
+
+def test_next_cache_files_are_not_pickled(backend):
+    np = main.np
+    now_dt = datetime.now()
+    main.save_tasks(random_tasks(100, 5, now_dt))
+    main.load_next_cached(5, int(now_dt.timestamp()))
+
+    if np is not None:
+        with np.load(main.NEXT_CACHE_NPZ, allow_pickle=False) as z:
+            assert "keys" in z.files
+    else:
+        with open(main.NEXT_CACHE_DATA_JSON, encoding="utf-8") as f:
+            assert "keys" in json.load(f)